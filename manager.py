@@ -15,12 +15,18 @@ Features:
 API Version: 1.0.0
 """
 
+import bisect
+import collections
 import logging
 import requests
 import time
-from datetime import datetime
-from typing import Dict, Any, List, Optional
-from PIL import Image, ImageDraw
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
 
 from src.plugin_system.base_plugin import BasePlugin
@@ -38,7 +44,19 @@ except ImportError:
         # Fallback if weather icons not available
         class WeatherIcons:
             @staticmethod
-            def draw_weather_icon(image, icon_code, x, y, size):
+            def preload(sizes):
+                pass
+
+            @staticmethod
+            def load_weather_icon(icon_code, size):
+                # Simple fallback - just a circle
+                icon = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+                draw = ImageDraw.Draw(icon)
+                draw.ellipse([0, 0, size - 1, size - 1], outline=(255, 255, 255), width=2)
+                return icon
+
+            @staticmethod
+            def draw_weather_icon(image, icon_code, x, y, size, background=None):
                 # Simple fallback - just draw a circle
                 draw = ImageDraw.Draw(image)
                 draw.ellipse([x, y, x + size, y + size], outline=(255, 255, 255), width=2)
@@ -52,6 +70,25 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Upper bounds (inclusive) of the low/moderate/high/very high UV index bands
+_UV_BREAKS = (2, 5, 7, 10)
+
+# Hour labels ("12a" .. "11p") by tm_hour and day names by tm_wday
+_HOURS_12 = tuple(f"{(h % 12) or 12}{'a' if h < 12 else 'p'}" for h in range(24))
+_DAY_NAMES = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+# Cardinal direction for every whole degree of wind bearing
+_WIND_LUT = tuple(('N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW')[round(d / 45) % 8] for d in range(360))
+
+# Scratch surface used only for measuring text
+_MEASURE_DRAW = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+
+
+@lru_cache(maxsize=512)
+def _text_width(text: str, font) -> float:
+    """Return the rendered width of text in font (fonts hash by identity)."""
+    return _MEASURE_DRAW.textlength(text, font=font)
+
 
 class WeatherPlugin(BasePlugin):
     """
@@ -106,22 +143,68 @@ class WeatherPlugin(BasePlugin):
         self.forecast_data = None
         self.hourly_forecast = None
         self.daily_forecast = None
-        self.last_update = 0
+        self.last_update = 0  # When the displayed data was fetched (shown in the web UI)
+        self._last_attempt = 0  # When the last fetch was started, successful or not
+        
+        # Geocoded coordinates: (location_key, lat, lon). The configured city
+        # doesn't change at runtime, so it only needs resolving once.
+        self._geo_cache = None
+        
+        # (url, ETag, parsed body) of the last One Call response, used to make
+        # conditional requests that skip the download when nothing changed
+        self._onecall_etag = None
+        
+        # API requests run on a single background worker so a slow response
+        # never stalls the display loop; results are applied in update()
+        self._fetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='weather-fetch')
+        self._fetch_future: Optional[Future] = None
+        self._fetch_started = 0
+        self._cache_checked = False
+        self._api_calls = 0  # Requests made by the current fetch
+        
+        # Client-side sliding window keeping us under the free tier's 60 calls/minute
+        self._call_times = collections.deque(maxlen=60)
+        self.max_calls_per_minute = 58
         
-        # Error handling and throttling
+        # Error handling and throttling. The polling interval adapts AIMD-style:
+        # it grows multiplicatively on failures and shrinks additively back to
+        # the configured interval on success, in steps sized so recovery takes
+        # a few polls.
+        self.min_update_interval = self.update_interval
+        self.max_update_interval = max(7200, self.update_interval)
+        self.interval_decrease_step = max(1, self.min_update_interval // 4)
+        self.interval_increase_factor = 1.5
+        # Until the first data arrives, failed fetches are retried quickly
+        # (30s, 60s, ... up to 5 minutes) instead of waiting a full interval
+        self.no_data_retry_base = 30
+        self.no_data_retry_max = 300
         self.consecutive_errors = 0
-        self.last_error_time = 0
-        self.error_backoff_time = 60
-        self.max_consecutive_errors = 5
         self.error_log_throttle = 300  # Only log errors every 5 minutes
         self.last_error_log_time = 0
+        self.rate_limited_until = 0  # Set when the API reports its quota is nearly spent
         
-        # State caching for display optimization
-        self.last_weather_state = None
-        self.last_hourly_state = None
-        self.last_daily_state = None
+        # State caching for display optimization: _data_version is bumped whenever
+        # new data is applied, and each view remembers the version it last drew
+        self._data_version = 0
+        self.last_weather_version = None
+        self.last_hourly_version = None
+        self.last_daily_version = None
         self.current_display_mode = None  # Track current mode to detect switches
         
+        # Static per-mode layout geometry, keyed by (mode, width, height, count)
+        self._layout_cache = {}
+        
+        # Framebuffer reused across redraws instead of allocating a new image each time
+        self._framebuf = None
+        self._draw = None
+        
+        # Matrix size the hourly column tiles were rendered for
+        self._hourly_tiles_size = None
+        
+        # Rendered daily forecast columns (LRU) and the matrix size they were rendered for
+        self._daily_tile_cache = collections.OrderedDict()
+        self._daily_tile_size = None
+        
         # Internal mode cycling (similar to hockey plugin)
         # Build list of enabled modes in order
         self.modes = []
@@ -136,6 +219,13 @@ class WeatherPlugin(BasePlugin):
         if not self.modes:
             self.modes = ['weather']
         
+        # Render method for each mode
+        self._mode_dispatch = {
+            'weather': self._display_current_weather,
+            'hourly_forecast': self._display_hourly_forecast,
+            'daily_forecast': self._display_daily_forecast
+        }
+        
         self.current_mode_index = 0
         self.last_mode_switch = 0
         self.display_duration = config.get('display_duration', 30)
@@ -162,6 +252,13 @@ class WeatherPlugin(BasePlugin):
             'uv_very_high': (200, 0, 0),
             'uv_extreme': (150, 0, 200)
         }
+        self._uv_colors = (
+            self.COLORS['uv_low'],
+            self.COLORS['uv_moderate'],
+            self.COLORS['uv_high'],
+            self.COLORS['uv_very_high'],
+            self.COLORS['uv_extreme']
+        )
         
         # Resolve project root path (plugin_dir -> plugins -> project_root)
         self.project_root = Path(__file__).resolve().parent.parent.parent
@@ -169,9 +266,33 @@ class WeatherPlugin(BasePlugin):
         # Weather icons path (Note: WeatherIcons class resolves paths itself, this is just for reference)
         self.icons_dir = self.project_root / 'assets' / 'weather'
         
+        # Persistent HTTP session: reuses TCP/TLS connections across requests
+        # and retries transient server errors with a short backoff. 429s and
+        # Retry-After are left to update()'s non-blocking rate_limited_until
+        # handling rather than sleeping on the fetch worker.
+        self._http = requests.Session()
+        self._http.headers['User-Agent'] = 'ledmatrix-weather'
+        retry = Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=[500, 502, 503, 504],
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry)
+        self._http.mount('https://', adapter)
+        self._http.mount('http://', adapter)
+        
         # Register fonts
         self._register_fonts()
         
+        # Font for the "No Weather Data" message, loaded once rather than per frame
+        self._no_data_font = self._load_font('4x6-font.ttf', 8)
+        
+        # Decode and resize every icon up front at the sizes the views draw them
+        # (current weather and forecast columns), so no redraw has to
+        WeatherIcons.preload((self.ICON_SIZE['extra_large'], self.ICON_SIZE['large']))
+        
         self.logger.info(f"Weather plugin initialized for {self.location.get('city', 'Unknown')}")
         self.logger.info(f"Units: {self.units}, Update interval: {self.update_interval}s")
     
@@ -213,100 +334,246 @@ class WeatherPlugin(BasePlugin):
         except Exception as e:
             self.logger.warning(f"Error registering fonts: {e}")
     
+    def _load_font(self, filename: str, size: int):
+        """Load a TrueType font from the project's assets/fonts, falling back to PIL's default."""
+        try:
+            # Resolve font path relative to project root
+            font_path = self.project_root / 'assets' / 'fonts' / filename
+            return ImageFont.truetype(str(font_path), size)
+        except Exception:
+            return ImageFont.load_default()
+    
     def update(self) -> None:
         """
         Update weather data from OpenWeatherMap API.
         
-        Fetches current conditions and forecast data, respecting
-        update intervals and error backoff periods.
+        Fetches current conditions and forecast data on a background thread,
+        respecting update intervals and error backoff periods. Results are
+        picked up on a later call once the fetch has completed.
         """
         current_time = time.time()
         
+        # Collect the result of an in-flight fetch without blocking
+        if self._fetch_future is not None:
+            if not self._fetch_future.done():
+                return
+            future, self._fetch_future = self._fetch_future, None
+            self._handle_fetch_result(future, current_time)
+        
+        # On startup, show cached data right away even if it is somewhat stale;
+        # a background refresh follows once it is older than update_interval
+        if not self._cache_checked:
+            self._cache_checked = True
+            self._load_cached_weather()
+        
         # Check if we need to update
-        if current_time - self.last_update < self.update_interval:
+        if current_time - self._last_attempt < self._next_fetch_delay():
             return
         
-        # Check if we're in error backoff period
-        if self.consecutive_errors >= self.max_consecutive_errors:
-            if current_time - self.last_error_time < self.error_backoff_time:
-                self.logger.debug(f"In error backoff period, retrying in {self.error_backoff_time - (current_time - self.last_error_time):.0f}s")
-                return
-            else:
-                # Reset error count after backoff
-                self.consecutive_errors = 0
-                self.error_backoff_time = 60
+        # Check if the API asked us to slow down
+        if current_time < self.rate_limited_until:
+            self.logger.debug(f"Rate limited by API, retrying in {self.rate_limited_until - current_time:.0f}s")
+            return
         
         # Validate API key
         if not self.api_key or self.api_key == "YOUR_OPENWEATHERMAP_API_KEY":
             self.logger.warning("No valid OpenWeatherMap API key configured")
             return
         
-        # Try to fetch weather data
+        # Start fetching weather data in the background
         try:
-            self._fetch_weather()
-            self.last_update = current_time
-            self.consecutive_errors = 0
+            self._fetch_future = self._fetch_pool.submit(self._fetch_weather)
+        except RuntimeError:
+            # Executor already shut down by cleanup(); nothing to fetch
+            self.logger.debug("Weather fetch skipped, plugin has been cleaned up")
+            return
+        self._fetch_started = current_time
+    
+    def _handle_fetch_result(self, future: Future, current_time: float) -> None:
+        """Apply the outcome of a completed background fetch."""
+        try:
+            data = future.result()
+        except requests.HTTPError as e:
+            response = e.response
+            retry_after = None
+            if response is not None and response.status_code in (429, 503):
+                retry_after = self._parse_retry_after(response.headers.get('Retry-After'))
+            self._record_fetch_error(e, current_time, retry_after)
+            return
         except Exception as e:
-            self.consecutive_errors += 1
-            self.last_error_time = current_time
-            
-            # Exponential backoff: double the backoff time (max 1 hour)
-            self.error_backoff_time = min(self.error_backoff_time * 2, 3600)
-            
-            # Only log errors periodically to avoid spam
-            if current_time - self.last_error_log_time > self.error_log_throttle:
-                self.logger.error(f"Error updating weather (attempt {self.consecutive_errors}/{self.max_consecutive_errors}): {e}")
-                if self.consecutive_errors >= self.max_consecutive_errors:
-                    self.logger.error(f"Weather API disabled for {self.error_backoff_time} seconds due to repeated failures")
-                self.last_error_log_time = current_time
+            self._record_fetch_error(e, current_time)
+            return
+        
+        if data:
+            try:
+                self._apply_weather_data(data)
+            except Exception as e:
+                # Malformed data counts as a failed fetch and backs off like one
+                self._record_fetch_error(e, current_time)
+                return
+            self.last_update = self._fetch_started
+        self._last_attempt = self._fetch_started
+        self.consecutive_errors = 0
+        self.update_interval = max(self.min_update_interval,
+                                   self.update_interval - self.interval_decrease_step)
+    
+    def _apply_weather_data(self, data: Dict[str, Any]) -> None:
+        """
+        Make fetched or cached weather data the data being displayed.
+        
+        The forecast is processed first; if it is malformed the exception
+        propagates and the previously displayed data is left untouched.
+        """
+        current = data['current']
+        forecast = data['forecast']
+        self._process_forecast_data(forecast)
+        self.weather_data = current
+        self.forecast_data = forecast
+        self._data_version += 1
+    
+    def _load_cached_weather(self) -> None:
+        """Serve cached weather data up to two update intervals old (stale-while-revalidate)."""
+        cached_data = self.cache_manager.get('weather', max_age=self.update_interval * 2)
+        if not (cached_data and cached_data.get('current') and cached_data.get('forecast')):
+            return
+        
+        try:
+            self._apply_weather_data(cached_data)
+        except Exception as e:
+            # A malformed cache entry is ignored; the regular fetch replaces it
+            self.logger.warning(f"Ignoring unusable cached weather data: {e}")
+            return
+        # Schedule the next fetch relative to when this data was fetched
+        self.last_update = self._last_attempt = cached_data.get('fetched_at', 0)
+        self.logger.info("Showing cached weather data while refreshing")
     
-    def _fetch_weather(self) -> None:
-        """Fetch weather data from OpenWeatherMap API."""
+    def _record_fetch_error(self, error: Exception, current_time: float,
+                            retry_after: Optional[float] = None) -> None:
+        """Track a failed fetch and back off the polling interval."""
+        self.consecutive_errors += 1
+        self._last_attempt = current_time
+        self.update_interval = min(self.max_update_interval,
+                                   int(self.update_interval * self.interval_increase_factor))
+        
+        if retry_after is not None:
+            # Server told us how long to wait - never retry sooner than that
+            self.rate_limited_until = max(self.rate_limited_until, current_time + retry_after)
+        
+        # Only log errors periodically to avoid spam
+        if current_time - self.last_error_log_time > self.error_log_throttle:
+            self.logger.error(f"Error updating weather (failure {self.consecutive_errors}): {error}")
+            self.logger.error(f"Next weather update in {self._next_fetch_delay()} seconds")
+            self.last_error_log_time = current_time
+    
+    def _next_fetch_delay(self) -> int:
+        """Seconds to wait after the last fetch attempt before starting another."""
+        if self.weather_data is None and self.consecutive_errors:
+            # Nothing to show yet (e.g. network not up at boot): retry soon
+            return min(self.no_data_retry_max,
+                       self.no_data_retry_base * 2 ** (self.consecutive_errors - 1))
+        return self.update_interval
+    
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+    
+    def _check_rate_limit(self, response) -> None:
+        """Defer the next update if the API reports fewer than 2 requests remaining."""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        if remaining is None:
+            return
+        try:
+            if int(remaining) >= 2:
+                return
+        except ValueError:
+            return
+        
+        now = time.time()
+        wait = 60.0
+        try:
+            reset = float(response.headers.get('X-RateLimit-Reset', ''))
+            # Reset may be an absolute epoch timestamp or a number of seconds
+            wait = reset - now if reset > now else reset
+        except ValueError:
+            pass
+        wait = max(wait, 1.0)
+        self.rate_limited_until = now + wait
+        self.logger.warning(f"Weather API quota nearly exhausted, pausing requests for {wait:.0f}s")
+    
+    def _fetch_weather(self) -> Optional[Dict[str, Any]]:
+        """
+        Fetch weather data from OpenWeatherMap API.
+        
+        Runs on the background fetch worker, so it only returns the data;
+        plugin display state is updated by update() on the caller's thread.
+        
+        Returns:
+            Dict with 'current' and 'forecast' data, or None if the location
+            could not be resolved.
+        """
         # Check cache first - use update_interval as max_age to respect configured refresh rate
         cache_key = 'weather'
         cached_data = self.cache_manager.get(cache_key, max_age=self.update_interval)
-        if cached_data:
-            self.weather_data = cached_data.get('current')
-            self.forecast_data = cached_data.get('forecast')
-            if self.weather_data and self.forecast_data:
-                self._process_forecast_data(self.forecast_data)
-                self.logger.info("Using cached weather data")
-                return
+        if cached_data and cached_data.get('current') and cached_data.get('forecast'):
+            self.logger.info("Using cached weather data")
+            return cached_data
+        
+        # Fetch fresh data, reporting all requests made to the API counter at once
+        self._api_calls = 0
+        try:
+            data = self._request_weather()
+        finally:
+            if self._api_calls:
+                increment_api_counter('weather', self._api_calls)
         
-        # Fetch fresh data
+        if data:
+            # Cache the data
+            self.cache_manager.set(cache_key, data)
+        return data
+    
+    def _request_weather(self) -> Optional[Dict[str, Any]]:
+        """Request current conditions and forecast from the One Call API."""
         city = self.location.get('city', 'Dallas')
         state = self.location.get('state', 'Texas')
         country = self.location.get('country', 'US')
         
-        # Get coordinates using geocoding API
-        geo_url = f"http://api.openweathermap.org/geo/1.0/direct?q={city},{state},{country}&limit=1&appid={self.api_key}"
-        
-        response = requests.get(geo_url, timeout=10)
-        response.raise_for_status()
-        geo_data = response.json()
-        
-        # Increment API counter for geocoding call
-        increment_api_counter('weather', 1)
-        
-        if not geo_data:
+        # Get coordinates (geocoding API is only hit on first lookup)
+        coords = self._get_coordinates(city, state, country)
+        if not coords:
             self.logger.error(f"Could not find coordinates for {city}, {state}")
-            return
+            return None
         
-        lat = geo_data[0]['lat']
-        lon = geo_data[0]['lon']
+        lat, lon = coords
         
         # Get weather data using One Call API
         one_call_url = f"https://api.openweathermap.org/data/3.0/onecall?lat={lat}&lon={lon}&exclude=minutely,alerts&appid={self.api_key}&units={self.units}"
         
-        response = requests.get(one_call_url, timeout=10)
-        response.raise_for_status()
-        one_call_data = response.json()
+        headers = None
+        if self._onecall_etag and self._onecall_etag[0] == one_call_url:
+            headers = {'If-None-Match': self._onecall_etag[1]}
         
-        # Increment API counter for weather data call
-        increment_api_counter('weather', 1)
+        response = self._api_get(one_call_url, headers=headers)
+        if response.status_code == 304:
+            # Not modified since the last download; reuse the parsed body
+            self.logger.debug("One Call data not modified, reusing previous response")
+            one_call_data = self._onecall_etag[2]
+        else:
+            one_call_data = response.json()
+            etag = response.headers.get('ETag')
+            self._onecall_etag = (one_call_url, etag, one_call_data) if etag else None
         
-        # Store current weather data
-        self.weather_data = {
+        # Current weather data
+        weather_data = {
             'main': {
                 'temp': one_call_data['current']['temp'],
                 'temp_max': one_call_data['daily'][0]['temp']['max'],
@@ -321,19 +588,63 @@ class WeatherPlugin(BasePlugin):
             }
         }
         
-        # Store forecast data
-        self.forecast_data = one_call_data
+        data = {
+            'current': weather_data,
+            'forecast': one_call_data,
+            'fetched_at': time.time()
+        }
+        
+        self.logger.info(f"Weather data updated for {city}: {weather_data['main']['temp']}°")
+        return data
+    
+    def _get_coordinates(self, city: str, state: str, country: str) -> Optional[Tuple[float, float]]:
+        """Resolve the configured location to (lat, lon), reusing previous lookups."""
+        geo_key = f"{city}|{state}|{country}"
+        if self._geo_cache and self._geo_cache[0] == geo_key:
+            return self._geo_cache[1], self._geo_cache[2]
         
-        # Process forecast data
-        self._process_forecast_data(self.forecast_data)
+        # Coordinates for a city never change, so the persisted entry never expires
+        cached_geo = self.cache_manager.get('weather_geo', max_age=10 * 365 * 24 * 3600)
+        if cached_geo and cached_geo.get('key') == geo_key:
+            self._geo_cache = (geo_key, cached_geo['lat'], cached_geo['lon'])
+            return cached_geo['lat'], cached_geo['lon']
         
-        # Cache the data
-        self.cache_manager.set(cache_key, {
-            'current': self.weather_data,
-            'forecast': self.forecast_data
-        })
+        geo_url = f"https://api.openweathermap.org/geo/1.0/direct?q={city},{state},{country}&limit=1&appid={self.api_key}"
         
-        self.logger.info(f"Weather data updated for {city}: {self.weather_data['main']['temp']}°")
+        geo_data = self._api_get(geo_url).json()
+        
+        if not geo_data:
+            return None
+        
+        lat = geo_data[0]['lat']
+        lon = geo_data[0]['lon']
+        self._geo_cache = (geo_key, lat, lon)
+        self.cache_manager.set('weather_geo', {'key': geo_key, 'lat': lat, 'lon': lon})
+        return lat, lon
+    
+    def _api_get(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """GET an OpenWeatherMap endpoint, counting the request and checking rate limits."""
+        self._throttle()
+        response = self._http.get(url, headers=headers, timeout=(3.05, 10))
+        self._api_calls += 1
+        self._check_rate_limit(response)
+        response.raise_for_status()
+        return response
+    
+    def _throttle(self) -> None:
+        """Wait until a request fits in the per-minute window, then record it."""
+        now = time.time()
+        while self._call_times and now - self._call_times[0] >= 60:
+            self._call_times.popleft()
+        
+        if len(self._call_times) >= self.max_calls_per_minute:
+            wait = 60 - (now - self._call_times[0])
+            self.logger.warning(f"Weather API request limit reached, waiting {wait:.1f}s")
+            time.sleep(wait)
+            self._call_times.popleft()
+            now = time.time()
+        
+        self._call_times.append(now)
     
     def _process_forecast_data(self, forecast_data: Dict) -> None:
         """Process forecast data into hourly and daily lists."""
@@ -355,39 +666,55 @@ class WeatherPlugin(BasePlugin):
         
         # Get next 5 hours
         hourly_list = future_hourly[:5]
-        self.hourly_forecast = []
+        hourly_forecast = []
         
         for hour_data in hourly_list:
-            dt = datetime.fromtimestamp(hour_data['dt'])
+            local_time = time.localtime(hour_data['dt'])
             temp = round(hour_data['temp'])
             condition = hour_data['weather'][0]['main']
             icon_code = hour_data['weather'][0]['icon']
-            self.hourly_forecast.append({
-                'hour': dt.strftime('%I:00 %p').lstrip('0'),  # Format as "2:00 PM"
+            hourly_forecast.append({
+                'hour': _HOURS_12[local_time.tm_hour],  # Format as "2p"
                 'temp': temp,
+                'temp_label': f"{temp}°",
                 'condition': condition,
                 'icon': icon_code
             })
-
+        
         # Process daily forecast
         daily_list = forecast_data.get('daily', [])[1:4]  # Skip today (index 0) and get next 3 days
-        self.daily_forecast = []
+        daily_forecast = []
         
         for day_data in daily_list:
-            dt = datetime.fromtimestamp(day_data['dt'])
+            local_time = time.localtime(day_data['dt'])
             temp_high = round(day_data['temp']['max'])
             temp_low = round(day_data['temp']['min'])
             condition = day_data['weather'][0]['main']
             icon_code = day_data['weather'][0]['icon']
             
-            self.daily_forecast.append({
-                'date': dt.strftime('%a'),  # Day name (Mon, Tue, etc.)
-                'date_str': dt.strftime('%m/%d'),  # Date (4/8, 4/9, etc.)
+            daily_forecast.append({
+                'date': _DAY_NAMES[local_time.tm_wday],  # Day name (Mon, Tue, etc.)
+                'date_str': f"{local_time.tm_mon:02d}/{local_time.tm_mday:02d}",  # Date (04/08, 04/09, etc.)
                 'temp_high': temp_high,
                 'temp_low': temp_low,
+                'temp_label': f"{temp_low} / {temp_high}",
                 'condition': condition,
                 'icon': icon_code
             })
+        
+        # Only publish the lists once both were built, so a malformed entry
+        # can't leave one view updated and the other stale
+        self.hourly_forecast = hourly_forecast
+        self.daily_forecast = daily_forecast
+        
+        # Pre-render the hourly columns now rather than on every display tick
+        try:
+            self._render_hourly_tiles()
+        except Exception as e:
+            self._hourly_tiles_size = None
+            self.logger.warning(f"Error pre-rendering hourly forecast: {e}")
+        
+        self._data_version += 1
     
     def display(self, display_mode: str = None, force_clear: bool = False) -> None:
         """
@@ -408,47 +735,28 @@ class WeatherPlugin(BasePlugin):
         # Note: force_clear is handled by display_manager, not needed here
         # This parameter is kept for compatibility with BasePlugin interface
         
-        current_mode = None
-
-        # If a specific mode is requested (compatibility methods), honor it
-        if display_mode and display_mode in self.modes:
-            try:
-                requested_index = self.modes.index(display_mode)
-            except ValueError:
-                requested_index = None
-
-            if requested_index is not None:
-                current_mode = self.modes[requested_index]
-                if current_mode != self.current_display_mode:
-                    self.current_mode_index = requested_index
-                    self._on_mode_changed(current_mode)
-        else:
-            # Default rotation synchronized with display controller
-            if self.current_display_mode is None:
-                current_mode = self.modes[self.current_mode_index]
-                self._on_mode_changed(current_mode)
-            elif force_clear:
-                self.current_mode_index = (self.current_mode_index + 1) % len(self.modes)
-                current_mode = self.modes[self.current_mode_index]
+        if display_mode is None and not force_clear and self.current_display_mode is not None:
+            # Common path: no mode requested, keep showing the current mode
+            current_mode = self.modes[self.current_mode_index]
+        elif display_mode and display_mode in self.modes:
+            # A specific mode is requested (compatibility methods), honor it
+            current_mode = display_mode
+            if current_mode != self.current_display_mode:
+                self.current_mode_index = self.modes.index(display_mode)
                 self._on_mode_changed(current_mode)
-            else:
-                current_mode = self.modes[self.current_mode_index]
-        
-        # Ensure we have a mode even if none of the above paths triggered a change
-        if current_mode is None:
-            current_mode = self.current_display_mode or self.modes[self.current_mode_index]
-        
-        # Display the current mode
-        if current_mode == 'hourly_forecast' and self.show_hourly:
-            self._display_hourly_forecast()
-        elif current_mode == 'daily_forecast' and self.show_daily:
-            self._display_daily_forecast()
-        elif current_mode == 'weather' and self.show_current:
-            self._display_current_weather()
+        elif self.current_display_mode is None:
+            # Default rotation synchronized with display controller
+            current_mode = self.modes[self.current_mode_index]
+            self._on_mode_changed(current_mode)
+        elif force_clear:
+            self.current_mode_index = (self.current_mode_index + 1) % len(self.modes)
+            current_mode = self.modes[self.current_mode_index]
+            self._on_mode_changed(current_mode)
         else:
-            # Fallback: show current weather if mode doesn't match
-            self.logger.warning(f"Mode {current_mode} not available, showing current weather")
-            self._display_current_weather()
+            current_mode = self.modes[self.current_mode_index]
+        
+        # Display the current mode (self.modes only contains enabled modes)
+        self._mode_dispatch[current_mode]()
     
     def _on_mode_changed(self, new_mode: str) -> None:
         """Handle logic needed when switching display modes."""
@@ -457,118 +765,137 @@ class WeatherPlugin(BasePlugin):
 
         self.logger.info(f"Display mode changed from {self.current_display_mode} to {new_mode}")
         if new_mode == 'hourly_forecast':
-            self.last_hourly_state = None
+            self.last_hourly_version = None
             self.logger.debug("Reset hourly state cache for mode switch")
         elif new_mode == 'daily_forecast':
-            self.last_daily_state = None
+            self.last_daily_version = None
             self.logger.debug("Reset daily state cache for mode switch")
         else:
-            self.last_weather_state = None
+            self.last_weather_version = None
             self.logger.debug("Reset weather state cache for mode switch")
 
         self.current_display_mode = new_mode
         self.last_mode_switch = time.time()
     
+    def _ensure_buffer(self) -> None:
+        """(Re)allocate the framebuffer and its ImageDraw when the matrix size changes."""
+        size = (self.display_manager.matrix.width, self.display_manager.matrix.height)
+        if self._framebuf is None or self._framebuf.size != size:
+            self._framebuf = Image.new('RGB', size, (0, 0, 0))
+            self._draw = ImageDraw.Draw(self._framebuf)
+    
+    def _begin_frame(self, clear_display: bool = True) -> Tuple[Image.Image, ImageDraw.ImageDraw]:
+        """
+        Return the framebuffer, cleared to black, with its ImageDraw.
+        
+        With clear_display, the display itself is cleared first. Views redrawn on
+        every tick must pass False, since clearing blanks the panel and flickers.
+        """
+        if clear_display:
+            self.display_manager.clear()
+        self._ensure_buffer()
+        img = self._framebuf
+        img.paste((0, 0, 0), (0, 0) + img.size)
+        return img, self._draw
+    
+    def _end_frame(self) -> None:
+        """Hand the framebuffer to the display manager and push it to the matrix."""
+        self.display_manager.image = self._framebuf
+        self.display_manager.update_display()
+    
+    def _refresh_unchanged_display(self) -> None:
+        """Restore the last rendered frame if the display image was replaced since it was pushed."""
+        if self._framebuf is not None and self.display_manager.image is not self._framebuf:
+            # The display image was replaced (e.g. cleared) since our last redraw
+            self.display_manager.image = self._framebuf
+            self.display_manager.update_display()
+    
     def _display_no_data(self) -> None:
         """Display a message when no weather data is available."""
-        img = Image.new('RGB', (self.display_manager.matrix.width, self.display_manager.matrix.height), (0, 0, 0))
-        draw = ImageDraw.Draw(img)
+        draw = self._begin_frame(clear_display=False)[1]
         
         # Simple text display
-        from PIL import ImageFont
-        try:
-            # Resolve font path relative to project root
-            font_path = self.project_root / 'assets' / 'fonts' / '4x6-font.ttf'
-            font = ImageFont.truetype(str(font_path), 8)
-        except:
-            font = ImageFont.load_default()
-        
+        font = self._no_data_font
         draw.text((5, 12), "No Weather", font=font, fill=(200, 200, 200))
         draw.text((5, 20), "Data", font=font, fill=(200, 200, 200))
         
-        self.display_manager.image = img
-        self.display_manager.update_display()
+        self._end_frame()
     
     def _display_current_weather(self) -> None:
         """Display current weather conditions using comprehensive layout with icons."""
         try:
-            # Check if state has changed
-            current_state = self._get_weather_state()
-            if current_state == self.last_weather_state:
-                # No need to redraw, but still update display for web preview snapshot
-                self.display_manager.update_display()
+            # Check if data has changed since the last redraw
+            if self._data_version == self.last_weather_version:
+                # Nothing to redraw; the matrix already shows this frame
+                self._refresh_unchanged_display()
                 return
 
-            # Clear the display
-            self.display_manager.clear()
+            display_manager = self.display_manager
+            colors = self.COLORS
+            small_font = display_manager.small_font
             
-            # Create a new image for drawing
-            img = Image.new('RGB', (self.display_manager.matrix.width, self.display_manager.matrix.height), (0, 0, 0))
-            draw = ImageDraw.Draw(img)
+            img, draw = self._begin_frame()
+            width, height = img.size
             
             # Get weather info
-            temp = int(self.weather_data['main']['temp'])
-            condition = self.weather_data['weather'][0]['main']
-            icon_code = self.weather_data['weather'][0]['icon']
-            humidity = self.weather_data['main']['humidity']
-            pressure = self.weather_data['main']['pressure']
-            wind_speed = self.weather_data['wind'].get('speed', 0)
-            wind_deg = self.weather_data['wind'].get('deg', 0)  # Wind direction not always provided
-            uv_index = self.weather_data['main'].get('uvi', 0)
+            main = self.weather_data['main']
+            weather = self.weather_data['weather'][0]
+            wind = self.weather_data['wind']
+            temp = int(main['temp'])
+            condition = weather['main']
+            icon_code = weather['icon']
+            humidity = main['humidity']
+            wind_speed = wind.get('speed', 0)
+            wind_deg = wind.get('deg', 0)  # Wind direction not always provided
+            uv_index = main.get('uvi', 0)
             
             # Get daily high/low from the first day of forecast
-            temp_high = int(self.weather_data['main']['temp_max'])
-            temp_low = int(self.weather_data['main']['temp_min'])
+            temp_high = int(main['temp_max'])
+            temp_low = int(main['temp_min'])
+            
+            layout = self._get_current_layout(width, height)
             
             # --- Top Left: Weather Icon ---
-            icon_size = self.ICON_SIZE['extra_large']
-            icon_x = 1
-            # Center the icon vertically in the top two-thirds of the display
-            available_height = (self.display_manager.matrix.height * 2) // 3
-            icon_y = (available_height - icon_size) // 2
-            WeatherIcons.draw_weather_icon(img, icon_code, icon_x, icon_y, size=icon_size)
+            self._draw_icon(img, icon_code, layout['icon_x'], layout['icon_y'], layout['icon_size'])
             
             # --- Top Right: Condition Text ---
-            condition_font = self.display_manager.small_font
-            condition_text_width = draw.textlength(condition, font=condition_font)
-            condition_x = self.display_manager.matrix.width - condition_text_width - 1
+            condition_text_width = _text_width(condition, small_font)
+            condition_x = width - condition_text_width - 1
             condition_y = 1
-            draw.text((condition_x, condition_y), condition, font=condition_font, fill=self.COLORS['text'])
+            draw.text((condition_x, condition_y), condition, font=small_font, fill=colors['text'])
 
             # --- Right Side: Current Temperature ---
             temp_text = f"{temp}°"
-            temp_font = self.display_manager.small_font
-            temp_text_width = draw.textlength(temp_text, font=temp_font)
-            temp_x = self.display_manager.matrix.width - temp_text_width - 1
+            temp_text_width = _text_width(temp_text, small_font)
+            temp_x = width - temp_text_width - 1
             temp_y = condition_y + 8
-            draw.text((temp_x, temp_y), temp_text, font=temp_font, fill=self.COLORS['highlight'])
+            draw.text((temp_x, temp_y), temp_text, font=small_font, fill=colors['highlight'])
             
             # --- Right Side: High/Low Temperature ---
             high_low_text = f"{temp_low}°/{temp_high}°"
-            high_low_font = self.display_manager.small_font
-            high_low_width = draw.textlength(high_low_text, font=high_low_font)
-            high_low_x = self.display_manager.matrix.width - high_low_width - 1
+            high_low_width = _text_width(high_low_text, small_font)
+            high_low_x = width - high_low_width - 1
             high_low_y = temp_y + 8
-            draw.text((high_low_x, high_low_y), high_low_text, font=high_low_font, fill=self.COLORS['dim'])
+            draw.text((high_low_x, high_low_y), high_low_text, font=small_font, fill=colors['dim'])
             
             # --- Bottom: Additional Metrics ---
-            display_width = self.display_manager.matrix.width
-            section_width = display_width // 3
-            y_pos = self.display_manager.matrix.height - 7
-            font = self.display_manager.extra_small_font
+            section_width = layout['section_width']
+            y_pos = layout['metrics_y']
+            font = display_manager.extra_small_font
+            dim = colors['dim']
 
             # --- UV Index (Section 1) ---
             uv_prefix = "UV:"
             uv_value_text = f"{uv_index:.0f}"
             
-            prefix_width = draw.textlength(uv_prefix, font=font)
-            value_width = draw.textlength(uv_value_text, font=font)
+            prefix_width = _text_width(uv_prefix, font)
+            value_width = _text_width(uv_value_text, font)
             total_width = prefix_width + value_width
             
             start_x = (section_width - total_width) // 2
             
             # Draw "UV:" prefix
-            draw.text((start_x, y_pos), uv_prefix, font=font, fill=self.COLORS['dim'])
+            draw.text((start_x, y_pos), uv_prefix, font=font, fill=dim)
 
             # Draw UV value with color
             uv_color = self._get_uv_color(uv_index)
@@ -576,77 +903,108 @@ class WeatherPlugin(BasePlugin):
             
             # --- Humidity (Section 2) ---
             humidity_text = f"H:{humidity}%"
-            humidity_width = draw.textlength(humidity_text, font=font)
+            humidity_width = _text_width(humidity_text, font)
             humidity_x = section_width + (section_width - humidity_width) // 2
-            draw.text((humidity_x, y_pos), humidity_text, font=font, fill=self.COLORS['dim'])
+            draw.text((humidity_x, y_pos), humidity_text, font=font, fill=dim)
 
             # --- Wind (Section 3) ---
             wind_dir = self._get_wind_direction(wind_deg)
             wind_text = f"W:{wind_speed:.0f}{wind_dir}"
-            wind_width = draw.textlength(wind_text, font=font)
+            wind_width = _text_width(wind_text, font)
             wind_x = (2 * section_width) + (section_width - wind_width) // 2
-            draw.text((wind_x, y_pos), wind_text, font=font, fill=self.COLORS['dim'])
+            draw.text((wind_x, y_pos), wind_text, font=font, fill=dim)
             
-            # Update the display
-            self.display_manager.image = img
-            self.display_manager.update_display()
-            self.last_weather_state = current_state
+            self._end_frame()
+            self.last_weather_version = self._data_version
 
         except Exception as e:
             self.logger.error(f"Error displaying current weather: {e}")
     
+    def _get_icon(self, icon_code: str, size: int) -> Optional[Image.Image]:
+        """Return the RGBA weather icon for a code and size (cached by WeatherIcons)."""
+        return WeatherIcons.load_weather_icon(icon_code, size)
+    
+    def _draw_icon(self, img: Image.Image, icon_code: str, x: int, y: int, size: int) -> None:
+        """Draw a weather icon onto a freshly cleared frame."""
+        # Nothing has been drawn under the icon yet, so it can be pasted as a
+        # tile pre-composited onto black instead of alpha-blended
+        WeatherIcons.draw_weather_icon(img, icon_code, x, y, size, background=(0, 0, 0))
+    
+    def _get_current_layout(self, width: int, height: int) -> Dict[str, int]:
+        """Return the static geometry of the current weather view for this matrix size."""
+        key = ('weather', width, height, 0)
+        layout = self._layout_cache.get(key)
+        if layout is None:
+            icon_size = self.ICON_SIZE['extra_large']
+            # Center the icon vertically in the top two-thirds of the display
+            available_height = (height * 2) // 3
+            layout = {
+                'icon_size': icon_size,
+                'icon_x': 1,
+                'icon_y': (available_height - icon_size) // 2,
+                'section_width': width // 3,
+                'metrics_y': height - 7
+            }
+            self._layout_cache[key] = layout
+        return layout
+    
+    def _get_hourly_layout(self, width: int, height: int, hours_to_show: int) -> List[Dict[str, int]]:
+        """Return per-column geometry of the hourly forecast view for this matrix size."""
+        key = ('hourly_forecast', width, height, hours_to_show)
+        layout = self._layout_cache.get(key)
+        if layout is None:
+            section_width = width // hours_to_show
+            padding = max(2, section_width // 6)
+            icon_size = self.ICON_SIZE['large']
+            icon_y = (height // 2) - 16
+            temp_y = height - 8
+            layout = []
+            for i in range(hours_to_show):
+                x = i * section_width + padding
+                center_x = x + (section_width - 2 * padding) // 2
+                layout.append({
+                    'section_x': i * section_width,
+                    'section_width': section_width,
+                    'center_x': center_x,
+                    'icon_x': center_x - icon_size // 2,
+                    'icon_y': icon_y,
+                    'temp_y': temp_y
+                })
+            self._layout_cache[key] = layout
+        return layout
+    
+    def _get_daily_layout(self, width: int, height: int, days_to_show: int) -> Dict[str, Any]:
+        """Return the column geometry of the daily forecast view for this matrix size.
+        
+        Positions other than 'section_xs' are relative to the start of a column.
+        """
+        key = ('daily_forecast', width, height, days_to_show)
+        layout = self._layout_cache.get(key)
+        if layout is None:
+            section_width = width // days_to_show
+            center_x = section_width // 2
+            icon_size = self.ICON_SIZE['large']
+            layout = {
+                'section_xs': tuple(i * section_width for i in range(days_to_show)),
+                'section_width': section_width,
+                'height': height,
+                'center_x': center_x,
+                'icon_size': icon_size,
+                # Icon centered horizontally, positioned vertically for the bottom text
+                'icon_x': center_x - icon_size // 2,
+                'icon_y': (height // 2) - 16,
+                'temp_y': height - 8
+            }
+            self._layout_cache[key] = layout
+        return layout
+    
     def _get_wind_direction(self, degrees: float) -> str:
         """Convert wind degrees to cardinal direction."""
-        directions = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']
-        index = round(degrees / 45) % 8
-        return directions[index]
+        return _WIND_LUT[round(degrees) % 360]
 
     def _get_uv_color(self, uv_index: float) -> tuple:
         """Get color based on UV index value."""
-        if uv_index <= 2:
-            return self.COLORS['uv_low']
-        elif uv_index <= 5:
-            return self.COLORS['uv_moderate']
-        elif uv_index <= 7:
-            return self.COLORS['uv_high']
-        elif uv_index <= 10:
-            return self.COLORS['uv_very_high']
-        else:
-            return self.COLORS['uv_extreme']
-    
-    def _get_weather_state(self) -> Dict[str, Any]:
-        """Get current weather state for comparison."""
-        if not self.weather_data:
-            return None
-        return {
-            'temp': round(self.weather_data['main']['temp']),
-            'condition': self.weather_data['weather'][0]['main'],
-            'humidity': self.weather_data['main']['humidity'],
-            'uvi': self.weather_data['main'].get('uvi', 0)
-        }
-
-    def _get_hourly_state(self) -> List[Dict[str, Any]]:
-        """Get current hourly forecast state for comparison."""
-        if not self.hourly_forecast:
-            return None
-        return [
-            {'hour': f['hour'], 'temp': round(f['temp']), 'condition': f['condition']}
-            for f in self.hourly_forecast[:3]
-        ]
-
-    def _get_daily_state(self) -> List[Dict[str, Any]]:
-        """Get current daily forecast state for comparison."""
-        if not self.daily_forecast:
-            return None
-        return [
-            {
-                'date': f['date'],
-                'temp_high': round(f['temp_high']),
-                'temp_low': round(f['temp_low']),
-                'condition': f['condition']
-            }
-            for f in self.daily_forecast[:4]
-        ]
+        return self._uv_colors[bisect.bisect_left(_UV_BREAKS, uv_index)]
     
     def _display_hourly_forecast(self) -> None:
         """Display hourly forecast with weather icons."""
@@ -656,67 +1014,87 @@ class WeatherPlugin(BasePlugin):
                 self._display_no_data()
                 return
             
-            # Check if state has changed
-            current_state = self._get_hourly_state()
-            if current_state == self.last_hourly_state:
-                # No need to redraw, but still update display for web preview snapshot
-                self.display_manager.update_display()
+            # Check if data has changed since the last redraw
+            if self._data_version == self.last_hourly_version:
+                # Nothing to redraw; the matrix already shows this frame
+                self._refresh_unchanged_display()
                 return
             
-            # Clear the display
-            self.display_manager.clear()
+            img = self._begin_frame()[0]
+            width, height = img.size
             
-            # Create a new image for drawing
-            img = Image.new('RGB', (self.display_manager.matrix.width, self.display_manager.matrix.height), (0, 0, 0))
-            draw = ImageDraw.Draw(img)
+            # Columns are pre-rendered when data arrives; rebuild only if the matrix size changed
+            if self._hourly_tiles_size != (width, height):
+                self._render_hourly_tiles()
             
-            # Calculate layout based on matrix dimensions
-            hours_to_show = min(4, len(self.hourly_forecast))
-            total_width = self.display_manager.matrix.width
-            section_width = total_width // hours_to_show
-            padding = max(2, section_width // 6)
+            hourly_forecast = self.hourly_forecast
+            for forecast in hourly_forecast[:min(4, len(hourly_forecast))]:
+                tile = forecast['tile']
+                img.paste(tile, (forecast['tile_x'], 0), tile)
             
-            for i in range(hours_to_show):
-                forecast = self.hourly_forecast[i]
-                x = i * section_width + padding
-                center_x = x + (section_width - 2 * padding) // 2
-                
-                # Draw hour at top
-                hour_text = forecast['hour']
-                hour_text = hour_text.replace(":00 ", "").replace("PM", "p").replace("AM", "a")
-                hour_width = draw.textlength(hour_text, font=self.display_manager.small_font)
-                draw.text((center_x - hour_width // 2, 1),
-                         hour_text,
-                         font=self.display_manager.small_font,
-                         fill=self.COLORS['text'])
-                
-                # Draw weather icon centered vertically between top/bottom text
-                icon_size = self.ICON_SIZE['large']
-                top_text_height = 8
-                bottom_text_y = self.display_manager.matrix.height - 8
-                available_height_for_icon = bottom_text_y - top_text_height
-                calculated_y = top_text_height + (available_height_for_icon - icon_size) // 2
-                icon_y = (self.display_manager.matrix.height // 2) - 16
-                icon_x = center_x - icon_size // 2
-                WeatherIcons.draw_weather_icon(img, forecast['icon'], icon_x, icon_y, icon_size)
-                
-                # Draw temperature at bottom
-                temp_text = f"{forecast['temp']}°"
-                temp_width = draw.textlength(temp_text, font=self.display_manager.small_font)
-                temp_y = self.display_manager.matrix.height - 8
-                draw.text((center_x - temp_width // 2, temp_y),
-                         temp_text,
-                         font=self.display_manager.small_font,
-                         fill=self.COLORS['text'])
-            
-            # Update the display
-            self.display_manager.image = img
-            self.display_manager.update_display()
-            self.last_hourly_state = current_state
+            self._end_frame()
+            self.last_hourly_version = self._data_version
 
         except Exception as e:
             self.logger.error(f"Error displaying hourly forecast: {e}")
     
+    def _render_hourly_tiles(self) -> None:
+        """
+        Render each visible hourly column (hour, icon, temperature) to its own tile.
+        
+        Tiles are transparent RGBA images stored on the forecast entries as
+        'tile', with 'tile_x' giving the paste position. A tile is widened
+        beyond its section when an icon or label overhangs it, so pasting the
+        tiles in order reproduces drawing the columns directly.
+        
+        This assumes the matrix's non-anti-aliased pixel fonts. Anti-aliased
+        text drawn over an icon's semi-transparent edges blends differently
+        on a transparent tile than on the black frame, so with a smooth font
+        those pixels can differ noticeably from direct drawing.
+        """
+        width, height = self.display_manager.matrix.width, self.display_manager.matrix.height
+        font = self.display_manager.small_font
+        hours_to_show = min(4, len(self.hourly_forecast))
+        if hours_to_show == 0:
+            self._hourly_tiles_size = (width, height)
+            return
+        
+        layout = self._get_hourly_layout(width, height, hours_to_show)
+        icon_size = self.ICON_SIZE['large']
+        
+        for forecast, column in zip(self.hourly_forecast, layout):
+            center_x = column['center_x']
+            hour_text = forecast['hour']
+            temp_text = forecast['temp_label']
+            hour_x = center_x - _text_width(hour_text, font) // 2
+            temp_x = center_x - _text_width(temp_text, font) // 2
+            
+            # Horizontal extent of everything drawn for this column
+            left = int(min(column['section_x'], hour_x, column['icon_x'], temp_x))
+            right = int(max(column['section_x'] + column['section_width'],
+                            hour_x + _text_width(hour_text, font),
+                            column['icon_x'] + icon_size,
+                            temp_x + _text_width(temp_text, font))) + 1
+            
+            tile = Image.new('RGBA', (right - left, height), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(tile)
+            
+            # Draw hour at top
+            draw.text((hour_x - left, 1), hour_text, font=font, fill=self.COLORS['text'])
+            
+            # Draw weather icon centered vertically between top/bottom text
+            icon = self._get_icon(forecast['icon'], icon_size)
+            if icon is not None:
+                tile.alpha_composite(icon, (column['icon_x'] - left, column['icon_y']))
+            
+            # Draw temperature at bottom
+            draw.text((temp_x - left, column['temp_y']), temp_text, font=font, fill=self.COLORS['text'])
+            
+            forecast['tile'] = tile
+            forecast['tile_x'] = left
+        
+        self._hourly_tiles_size = (width, height)
+    
     def _display_daily_forecast(self) -> None:
         """Display daily forecast with weather icons."""
         try:
@@ -724,70 +1102,101 @@ class WeatherPlugin(BasePlugin):
                 self._display_no_data()
                 return
             
-            # Check if state has changed
-            current_state = self._get_daily_state()
-            if current_state == self.last_daily_state:
-                # No need to redraw, but still update display for web preview snapshot
-                self.display_manager.update_display()
+            # Check if data has changed since the last redraw
+            if self._data_version == self.last_daily_version:
+                # Nothing to redraw; the matrix already shows this frame
+                self._refresh_unchanged_display()
                 return
             
-            # Clear the display
-            self.display_manager.clear()
+            display_manager = self.display_manager
+            colors = self.COLORS
+            small_font = display_manager.small_font
             
-            # Create a new image for drawing
-            img = Image.new('RGB', (self.display_manager.matrix.width, self.display_manager.matrix.height), (0, 0, 0))
-            draw = ImageDraw.Draw(img)
+            img, draw = self._begin_frame()
+            width, height = img.size
             
             # Calculate layout based on matrix dimensions for 3 days
-            days_to_show = min(3, len(self.daily_forecast))
+            daily_forecast = self.daily_forecast
+            days_to_show = min(3, len(daily_forecast))
             if days_to_show == 0:
                 # Handle case where there's no forecast data after filtering
-                draw.text((2, 2), "No daily forecast", font=self.display_manager.small_font, fill=self.COLORS['dim'])
+                draw.text((2, 2), "No daily forecast", font=small_font, fill=colors['dim'])
             else:
-                total_width = self.display_manager.matrix.width
-                section_width = total_width // days_to_show
-                padding = max(2, section_width // 6)
+                layout = self._get_daily_layout(width, height, days_to_show)
                 
-                for i in range(days_to_show):
-                    forecast = self.daily_forecast[i]
-                    x = i * section_width
-                    center_x = x + section_width // 2
-                    
-                    # Draw day name at top
-                    day_text = forecast['date']
-                    day_width = draw.textlength(day_text, font=self.display_manager.small_font)
-                    draw.text((center_x - day_width // 2, 1),
-                             day_text,
-                             font=self.display_manager.small_font,
-                             fill=self.COLORS['text'])
-                    
-                    # Draw weather icon centered vertically between top/bottom text
-                    icon_size = self.ICON_SIZE['large']
-                    top_text_height = 8
-                    bottom_text_y = self.display_manager.matrix.height - 8
-                    available_height_for_icon = bottom_text_y - top_text_height
-                    calculated_y = top_text_height + (available_height_for_icon - icon_size) // 2
-                    icon_y = (self.display_manager.matrix.height // 2) - 16
-                    icon_x = center_x - icon_size // 2
-                    WeatherIcons.draw_weather_icon(img, forecast['icon'], icon_x, icon_y, icon_size)
-                    
-                    # Draw high/low temperatures at bottom
-                    temp_text = f"{forecast['temp_low']} / {forecast['temp_high']}"
-                    temp_width = draw.textlength(temp_text, font=self.display_manager.extra_small_font)
-                    temp_y = self.display_manager.matrix.height - 8
-                    draw.text((center_x - temp_width // 2, temp_y),
-                             temp_text,
-                             font=self.display_manager.extra_small_font,
-                             fill=self.COLORS['text'])
-            
-            # Update the display
-            self.display_manager.image = img
-            self.display_manager.update_display()
-            self.last_daily_state = current_state
+                # Day columns are rendered once per distinct forecast and reused
+                if self._daily_tile_size != (width, height):
+                    self._daily_tile_cache.clear()
+                    self._daily_tile_size = (width, height)
+                
+                for i, section_x in enumerate(layout['section_xs']):
+                    tile, offset_x = self._get_daily_tile(daily_forecast[i], layout)
+                    img.paste(tile, (section_x + offset_x, 0), tile)
+            
+            self._end_frame()
+            self.last_daily_version = self._data_version
 
         except Exception as e:
             self.logger.error(f"Error displaying daily forecast: {e}")
     
+    def _get_daily_tile(self, forecast: Dict[str, Any],
+                        layout: Dict[str, Any]) -> Tuple[Image.Image, int]:
+        """
+        Return the rendered tile for one daily forecast column.
+        
+        Tiles are transparent RGBA images covering everything drawn for the
+        day, returned with their x offset from the start of the section.
+        """
+        section_width = layout['section_width']
+        height = layout['height']
+        key = (forecast['date'], forecast['icon'], forecast['temp_label'], section_width, height)
+        cached = self._daily_tile_cache.get(key)
+        if cached is not None:
+            self._daily_tile_cache.move_to_end(key)
+            return cached
+        
+        small_font = self.display_manager.small_font
+        extra_small_font = self.display_manager.extra_small_font
+        text_color = self.COLORS['text']
+        center_x = layout['center_x']
+        
+        day_text = forecast['date']
+        day_width = _text_width(day_text, small_font)
+        day_x = center_x - day_width // 2
+        
+        icon_size = layout['icon_size']
+        icon_x = layout['icon_x']
+        icon_y = layout['icon_y']
+        
+        temp_text = forecast['temp_label']
+        temp_width = _text_width(temp_text, extra_small_font)
+        temp_x = center_x - temp_width // 2
+        temp_y = layout['temp_y']
+        
+        # Horizontal extent of everything drawn for this day
+        left = int(min(0, day_x, icon_x, temp_x))
+        right = int(max(section_width, day_x + day_width, icon_x + icon_size, temp_x + temp_width)) + 1
+        
+        tile = Image.new('RGBA', (right - left, height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(tile)
+        
+        # Draw day name at top
+        draw.text((day_x - left, 1), day_text, font=small_font, fill=text_color)
+        
+        # Draw weather icon
+        icon = self._get_icon(forecast['icon'], icon_size)
+        if icon is not None:
+            tile.alpha_composite(icon, (icon_x - left, icon_y))
+        
+        # Draw high/low temperatures at bottom
+        draw.text((temp_x - left, temp_y), temp_text, font=extra_small_font, fill=text_color)
+        
+        cached = (tile, left)
+        self._daily_tile_cache[key] = cached
+        if len(self._daily_tile_cache) > 16:
+            self._daily_tile_cache.popitem(last=False)
+        return cached
+    
     def display_weather(self, force_clear: bool = False) -> None:
         """Display current weather (compatibility method for display controller)."""
         self.display('weather', force_clear)
@@ -803,6 +1212,8 @@ class WeatherPlugin(BasePlugin):
     def get_info(self) -> Dict[str, Any]:
         """Return plugin info for web UI."""
         info = super().get_info()
+        daily_forecast = self.daily_forecast
+        hourly_forecast = self.hourly_forecast
         info.update({
             'location': self.location,
             'units': self.units,
@@ -812,8 +1223,8 @@ class WeatherPlugin(BasePlugin):
             'current_humidity': self.weather_data.get('main', {}).get('humidity') if self.weather_data else None,
             'current_description': self.weather_data.get('weather', [{}])[0].get('description', '') if self.weather_data else '',
             'forecast_available': bool(self.forecast_data),
-            'daily_forecast_count': len(self.daily_forecast) if hasattr(self, 'daily_forecast') and self.daily_forecast is not None else 0,
-            'hourly_forecast_count': len(self.hourly_forecast) if hasattr(self, 'hourly_forecast') and self.hourly_forecast is not None else 0
+            'daily_forecast_count': len(daily_forecast) if daily_forecast else 0,
+            'hourly_forecast_count': len(hourly_forecast) if hourly_forecast else 0
         })
         return info
 
@@ -821,5 +1232,20 @@ class WeatherPlugin(BasePlugin):
         """Cleanup resources."""
         self.weather_data = None
         self.forecast_data = None
+        self._daily_tile_cache.clear()
+        self._fetch_pool.shutdown(wait=False, cancel_futures=True)
+        self.close()
         self.logger.info("Weather plugin cleaned up")
 
+    def close(self) -> None:
+        """Close the persistent HTTP session and its pooled connections."""
+        http = getattr(self, '_http', None)
+        if http is not None:
+            http.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
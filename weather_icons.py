@@ -7,13 +7,22 @@ Maps OpenWeatherMap icon codes to appropriate icon files.
 
 import os
 import math
+import time
 import logging
+from collections import OrderedDict
 from pathlib import Path
-from typing import Union
+from typing import Iterable, Tuple, Union
 from PIL import Image, ImageDraw
 
 logger = logging.getLogger(__name__)
 
+# Resample filter for icon downscaling, resolved once rather than per load
+_LANCZOS = Image.Resampling.LANCZOS
+
+# Unit direction vectors for the sun's 8 rays and the snowflakes' 3 diameters (6 arms)
+_SUN_DIRS = tuple((math.cos(math.radians(a)), math.sin(math.radians(a))) for a in range(0, 360, 45))
+_SNOW_DIRS = tuple((math.cos(math.radians(a)), math.sin(math.radians(a))) for a in range(0, 180, 60))
+
 
 class WeatherIcons:
     _PLUGIN_ICON_DIR = Path(__file__).resolve().parent / "assets" / "weather"
@@ -54,19 +63,49 @@ class WeatherIcons:
         "wind": "wind.png", # Generic wind if code is not specific enough
     }
 
+    # Icon file lookups never change for an install, so they are resolved once
+    _INDEX = None         # filename -> Path, built from one scan of ICON_PATHS
+    _CODE_CACHE = {}      # icon code -> (filename, resolved Path or None)
+
+    # LRU caches of decoded icons, bounded so unusual sizes can't grow them without limit.
+    # (icon, paste mask) pairs keyed by (icon path, size); codes sharing a file share an entry
+    CACHE_SIZE = 64
+    _ICON_CACHE = OrderedDict()
+
+    # Opaque icons pre-composited onto a solid background, keyed by (icon code, size, background)
+    _TILE_CACHE = OrderedDict()
+
     @classmethod
     def _resolve_icon_path(cls, filename: str) -> Union[Path, None]:
         """Resolve the full path for an icon by checking known asset directories."""
+        if cls._INDEX is None:
+            cls._INDEX = cls._build_index()
+        return cls._INDEX.get(filename)
+
+    @classmethod
+    def _build_index(cls) -> dict:
+        """Scan the icon directories once, mapping each filename to its path (earlier directories win)."""
+        index = {}
         for base_path in cls.ICON_PATHS:
-            if base_path and base_path.exists():
-                candidate = base_path / filename
-                if candidate.exists():
-                    return candidate
-        return None
+            if not base_path:
+                continue
+            try:
+                with os.scandir(base_path) as entries:
+                    for entry in entries:
+                        if entry.name not in index and entry.is_file():
+                            index[entry.name] = Path(entry.path)
+            except OSError:
+                # Directory missing or unreadable; try the next one
+                continue
+        return index
 
     @classmethod
-    def _get_icon_filename(cls, icon_code: str) -> str:
-        """Maps an OpenWeatherMap icon code (e.g., '01d', '10n') to an icon filename."""
+    def _get_icon_filename(cls, icon_code: str) -> Tuple[str, Union[Path, None]]:
+        """Maps an OpenWeatherMap icon code (e.g., '01d', '10n') to an icon filename and its resolved path."""
+        cached = cls._CODE_CACHE.get(icon_code)
+        if cached is not None:
+            return cached
+
         filename = cls.ICON_MAP.get(icon_code, cls.DEFAULT_ICON)
         logger.debug(f"Mapping icon code '{icon_code}' to filename: '{filename}'")
 
@@ -79,33 +118,61 @@ class WeatherIcons:
                 filename = cls.DEFAULT_ICON
             
             # Check if default exists
-            default_path = cls._resolve_icon_path(cls.DEFAULT_ICON)
-            if not default_path:
+            potential_path = cls._resolve_icon_path(cls.DEFAULT_ICON)
+            if not potential_path:
                 logger.error("Default weather icon file not found in any icon directory")
-                # Allow filename to remain DEFAULT_ICON name, load_weather_icon handles FileNotFoundError
+                # Allow filename to remain DEFAULT_ICON name, load_weather_icon reports the missing path
 
-        return filename
+        result = (filename, potential_path)
+        cls._CODE_CACHE[icon_code] = result
+        return result
 
     @staticmethod
     def load_weather_icon(icon_code: str, size: int = DEFAULT_SIZE) -> Union[Image.Image, None]:
         """Loads, converts, and resizes the appropriate weather icon based on the OWM code. Returns None on failure."""
-        filename = WeatherIcons._get_icon_filename(icon_code)
-        icon_path_obj = WeatherIcons._resolve_icon_path(filename)
+        entry = WeatherIcons._load_icon_entry(icon_code, size)
+        return entry[0] if entry else None
+
+    @staticmethod
+    def _load_icon_entry(icon_code: str, size: int) -> Union[Tuple[Image.Image, Union[Image.Image, None]], None]:
+        """
+        Return the cached (icon, mask) pair for an OWM code and size, loading it on first use.
+
+        The mask is the icon's alpha band, split out once so pasting doesn't
+        extract it again, or None for fully opaque icons that need no blending.
+        """
+        filename, icon_path_obj = WeatherIcons._get_icon_filename(icon_code)
         if not icon_path_obj:
             logger.error(f"Unable to resolve path for weather icon '{filename}'")
             return None
 
         icon_path = str(icon_path_obj)
+        cache_key = (icon_path, size)
+        cached = WeatherIcons._ICON_CACHE.get(cache_key)
+        if cached is not None:
+            # Callers only paste the icon, so the cached image is shared rather than copied
+            WeatherIcons._ICON_CACHE.move_to_end(cache_key)
+            return cached
 
         try:
-            # Open image and ensure it's RGBA for transparency handling
-            icon_img = Image.open(icon_path).convert("RGBA")
+            # Open image and ensure it's RGBA for transparency handling. Decode it
+            # inside the with-block so the file is closed, and skip the convert
+            # (a full copy) for PNGs that are already RGBA
+            with Image.open(icon_path) as icon_img:
+                icon_img.load()
+                if icon_img.mode != "RGBA":
+                    icon_img = icon_img.convert("RGBA")
 
             # Resize if necessary using high-quality downsampling (LANCZOS/ANTIALIAS)
             if icon_img.width != size or icon_img.height != size:
-                icon_img = icon_img.resize((size, size), Image.Resampling.LANCZOS)
+                icon_img = icon_img.resize((size, size), _LANCZOS)
 
-            return icon_img
+            alpha = icon_img.getchannel("A")
+            entry = (icon_img, None if alpha.getextrema() == (255, 255) else alpha)
+            WeatherIcons._ICON_CACHE[cache_key] = entry
+            if len(WeatherIcons._ICON_CACHE) > WeatherIcons.CACHE_SIZE:
+                WeatherIcons._ICON_CACHE.popitem(last=False)
+            return entry
         except FileNotFoundError:
             logger.error(f"Icon file not found: {icon_path}")
             # Don't try to load default here, _get_icon_filename already handled fallback logic
@@ -115,13 +182,42 @@ class WeatherIcons:
             return None
 
     @staticmethod
-    def draw_weather_icon(image: Image.Image, icon_code: str, x: int, y: int, size: int = DEFAULT_SIZE):
-        """Loads the appropriate weather icon based on OWM code and pastes it onto the target PIL Image object."""
-        icon_to_draw = WeatherIcons.load_weather_icon(icon_code, size)
-        if icon_to_draw:
+    def preload(sizes: Iterable[int]) -> None:
+        """Load every mapped icon at each of the given sizes into the icon cache."""
+        start = time.perf_counter()
+        for size in set(sizes):
+            for icon_code in WeatherIcons.ICON_MAP:
+                WeatherIcons._load_icon_entry(icon_code, size)
+        logger.debug(f"Preloaded {len(WeatherIcons._ICON_CACHE)} weather icons in {time.perf_counter() - start:.3f}s")
+
+    @staticmethod
+    def draw_weather_icon(image: Image.Image, icon_code: str, x: int, y: int, size: int = DEFAULT_SIZE,
+                          background: Union[tuple, None] = None):
+        """
+        Loads the appropriate weather icon based on OWM code and pastes it onto the target PIL Image object.
+
+        If background is given, the area under the icon must be that solid color;
+        the icon is then pasted as an opaque tile pre-composited onto it, which
+        skips the per-pixel alpha blend.
+        """
+        entry = WeatherIcons._load_icon_entry(icon_code, size)
+        if entry:
+            icon_to_draw, mask = entry
+            if background is not None and mask is not None:
+                tile_key = (icon_code, size, background)
+                tile = WeatherIcons._TILE_CACHE.get(tile_key)
+                if tile is None:
+                    tile = Image.new("RGB", icon_to_draw.size, background)
+                    tile.paste(icon_to_draw, (0, 0), mask)
+                    WeatherIcons._TILE_CACHE[tile_key] = tile
+                    if len(WeatherIcons._TILE_CACHE) > WeatherIcons.CACHE_SIZE:
+                        WeatherIcons._TILE_CACHE.popitem(last=False)
+                else:
+                    WeatherIcons._TILE_CACHE.move_to_end(tile_key)
+                icon_to_draw, mask = tile, None
             try:
-                # Paste the icon directly with its original alpha channel
-                image.paste(icon_to_draw, (x, y), icon_to_draw)
+                # Paste the icon with its cached alpha band (no mask for opaque icons)
+                image.paste(icon_to_draw, (x, y), mask)
             except Exception as e:
                 logger.error(f"Error processing or pasting icon for code '{icon_code}' at ({x},{y}): {e}")
         else:
@@ -145,12 +241,11 @@ class WeatherIcons:
         
         # Draw rays
         ray_length = size // 4
-        for angle in range(0, 360, 45):
-            rad = math.radians(angle)
-            start_x = center_x + (radius * math.cos(rad))
-            start_y = center_y + (radius * math.sin(rad))
-            end_x = center_x + ((radius + ray_length) * math.cos(rad))
-            end_y = center_y + ((radius + ray_length) * math.sin(rad))
+        for cos_a, sin_a in _SUN_DIRS:
+            start_x = center_x + (radius * cos_a)
+            start_y = center_y + (radius * sin_a)
+            end_x = center_x + ((radius + ray_length) * cos_a)
+            end_y = center_y + ((radius + ray_length) * sin_a)
             draw.line([start_x, start_y, end_x, end_y], fill=color, width=2)
 
     @staticmethod
@@ -204,12 +299,11 @@ class WeatherIcons:
             center_x = x + size//4 + (i * flake_spacing)
             center_y = y + size//2
             
-            # Draw 6-point snowflake
-            for angle in range(0, 360, 60):
-                rad = math.radians(angle)
-                end_x = center_x + (flake_size * math.cos(rad))
-                end_y = center_y + (flake_size * math.sin(rad))
-                draw.line([center_x, center_y, end_x, end_y], fill=snow_color, width=1)
+            # Draw 6-point snowflake as 3 lines through the center
+            for cos_a, sin_a in _SNOW_DIRS:
+                dx = flake_size * cos_a
+                dy = flake_size * sin_a
+                draw.line([center_x - dx, center_y - dy, center_x + dx, center_y + dy], fill=snow_color, width=1)
 
     @staticmethod
     def draw_thunderstorm(draw: ImageDraw, x: int, y: int, size: int = 16):
@@ -241,3 +335,9 @@ class WeatherIcons:
                 x + size//4 + size//2, wave_y + wave_height
             ], fill=mist_color, width=2)
 
+
+# Resolve every mapped icon code to its file once at import, so icon lookups
+# never probe the filesystem; codes sharing a file share the same Path
+for _icon_code in WeatherIcons.ICON_MAP:
+    WeatherIcons._get_icon_filename(_icon_code)
+del _icon_code